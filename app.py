@@ -1,22 +1,26 @@
 import streamlit as st
 from PIL import Image
 import google.generativeai as genai
+from google.api_core.exceptions import DeadlineExceeded, ResourceExhausted, ServiceUnavailable
 from dotenv import load_dotenv
 import os
 import base64
 from io import BytesIO
-import time
 import random
+import time
+import hashlib
+import math
+import json
+import html
 import asyncio
-
-# Load environment variables (including API key)
-load_dotenv()
+import concurrent.futures
+import threading
 
 # Configure the Streamlit page
 st.set_page_config(page_title="Plant Identifier", page_icon="🌿", layout="wide")
 
 # Define the CSS styles for the application
-st.markdown("""
+_CSS = """
 <style>
     .stApp {
         max-width: 1200px;
@@ -42,11 +46,6 @@ st.markdown("""
         width: 100%;
         margin-bottom: 1rem;
     }
-    .progress-text {
-        margin-top: 0.5rem;
-        font-weight: bold;
-        color: #4CAF50;
-    }
     .info-box {
         background-color: #2b2b2b;
         border-radius: 10px;
@@ -87,133 +86,148 @@ st.markdown("""
         }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_CSS, unsafe_allow_html=True)
 
-def get_fun_loading_messages():
-    """
-    Return a list of fun, engaging loading messages.
-    These messages add humor and personality to the loading process.
-    """
-    return [
-        "Your plants don't need therapy, just proper drainage. But they'll still appreciate you talking to them! 🌿 💭",
-        "Science says talking to plants helps them grow. But maybe skip the gossip – these walls have leaves. 🤫 🌱",
-        "Did you know plants can get sunburned? Even they need SPF (Shade Protection Factor) sometimes! ☀️ 🌿",
-        "Relationship status with my monstera: It's complicated. They asked for indirect light, then called me toxic for moving them away from the window. 💔 🪴",
-        "Overwatering is like overthinking – it drowns the potential. Let your plants and thoughts breathe a little. 💧 ✨",
-        "Missing your plant's watering schedule is like missing a text from your mom – they'll forgive you, but you'll never hear the end of it. 📱 🌵"
-    ]
+# Fun, engaging loading messages that add humor and personality to the loading process
+_MESSAGES = (
+    "Your plants don't need therapy, just proper drainage. But they'll still appreciate you talking to them! 🌿 💭",
+    "Science says talking to plants helps them grow. But maybe skip the gossip – these walls have leaves. 🤫 🌱",
+    "Did you know plants can get sunburned? Even they need SPF (Shade Protection Factor) sometimes! ☀️ 🌿",
+    "Relationship status with my monstera: It's complicated. They asked for indirect light, then called me toxic for moving them away from the window. 💔 🪴",
+    "Overwatering is like overthinking – it drowns the potential. Let your plants and thoughts breathe a little. 💧 ✨",
+    "Missing your plant's watering schedule is like missing a text from your mom – they'll forgive you, but you'll never hear the end of it. 📱 🌵"
+)
 
+@st.cache_resource(show_spinner=False)
 def initialize_gemini():
     """
-    Initialize the Gemini AI model with error handling.
-    Ensures secure API key configuration and model initialization.
+    Initialize the Gemini AI model.
+    Cached across reruns and sessions so the .env lookup and SDK setup run once.
+    Errors are raised rather than returned so that a failure is never cached.
     """
+    # Load environment variables (including API key)
+    load_dotenv()
     api_key = os.getenv('GOOGLE_API_KEY')
     if not api_key:
         st.error("⚠️ Please set your Google API key in the .env file")
         st.stop()
-    try:
-        genai.configure(api_key=api_key)
-        return genai.GenerativeModel('gemini-1.5-flash')
-    except Exception as e:
-        st.error(f"⚠️ Error initializing AI model: {str(e)}")
-        return None
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel('gemini-1.5-flash')
+
+# JPEG header entries that may identify the user or their device
+_JPEG_METADATA_KEYS = ('exif', 'xmp', 'photoshop', 'comment')
 
-def prepare_image(image):
+def prepare_image(raw: bytes):
     """
     Optimize image for AI processing by resizing and encoding.
     Reduces image size and converts to compatible format.
+    Small RGB JPEGs without metadata are passed through as-is.
+    Errors propagate so the caller can report them against the right file.
     """
-    try:
-        max_size = 300  # Optimal size for faster processing
-        if max(image.size) > max_size:
-            ratio = max_size / max(image.size)
-            new_size = tuple(int(dim * ratio) for dim in image.size)
-            image = image.resize(new_size, Image.LANCZOS)
-        
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-        
-        buffered = BytesIO()
-        image.save(buffered, format="JPEG", quality=50)  # Reduced quality for smaller file size
-        image_bytes = buffered.getvalue()
-        
+    max_size = 256  # Fits Gemini's image tiling and keeps token count low
+    image = Image.open(BytesIO(raw))
+    # Size, mode and metadata come from the JPEG header, so this check needs no decode.
+    # Images carrying EXIF (e.g. GPS location) or other metadata are re-encoded to strip it.
+    if (image.format == 'JPEG' and image.mode == 'RGB' and max(image.size) <= max_size
+            and not any(key in image.info for key in _JPEG_METADATA_KEYS)):
         return {
             "mime_type": "image/jpeg",
-            "data": base64.b64encode(image_bytes).decode('utf-8')
+            "data": base64.b64encode(raw).decode('utf-8')
         }
-    except Exception as e:
-        st.error(f"Error processing image: {str(e)}")
-        return None
 
-def get_plant_info_prompt():
-    """
-    Generate a structured prompt for AI to analyze plant images.
-    Provides clear instructions for detailed plant information.
-    """
-    return """
+    # Let libjpeg decode at a reduced scale close to the target size
+    image.draft('RGB', (max_size, max_size))
+    # Palette and 1-bit images only resample with nearest-neighbour, so convert those first
+    if image.mode in ('P', '1'):
+        image = image.convert('RGB')
+    # Resizes in place, and does nothing if the image already fits
+    image.thumbnail((max_size, max_size), Image.BILINEAR)
+    # Other modes are converted after shrinking, on far fewer pixels
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    
+    # Pre-size the buffer to fit a 256px, quality-50 JPEG so it rarely regrows while saving
+    buffered = BytesIO(bytearray(16 * 1024))
+    # Reduced quality, optimized Huffman tables and 4:2:0 subsampling for smaller file size
+    image.save(buffered, format="JPEG", quality=50, optimize=True, progressive=True, subsampling=2)
+    
+    return {
+        "mime_type": "image/jpeg",
+        # Encode straight from the buffer's memory (up to the bytes written) to avoid copying it out first
+        "data": base64.b64encode(buffered.getbuffer()[:buffered.tell()]).decode('ascii')
+    }
+
+# Structured prompt sent with every plant image
+_PROMPT = """
     Analyze the provided plant image and give the following information:
     1. Common Name: Provide the most widely recognized common name for this plant.
     2. Hindi Name: If there's a commonly used Hindi name, provide it. If not, state that there isn't a widely accepted Hindi name.
-    3. Seasonal Care Tips: Provide 2-3 specific care tips for each season (Spring, Summer, Monsoon, Winter). 
+    3. Seasonal Care Tips: Provide 2-3 short, specific care tips for each season (Spring, Summer, Monsoon, Winter). 
        If a tip doesn't apply to a particular season, provide a general care tip instead.
     
-    Format your response like this:
-    Common Name: [Plant's common name]
-    Hindi Name: [Hindi name or statement about lack of common Hindi name]
-    
-    Spring Care:
-    • [Tip 1]
-    • [Tip 2]
-    • [Tip 3]
-    
-    Summer Care:
-    • [Tip 1]
-    • [Tip 2]
-    • [Tip 3]
-    
-    Monsoon Care:
-    • [Tip 1]
-    • [Tip 2]
-    • [Tip 3]
-    
-    Winter Care:
-    • [Tip 1]
-    • [Tip 2]
-    • [Tip 3]
+    Respond with JSON containing "common_name", "hindi_name" and "care",
+    where "care" maps each season to its list of tips.
     """
 
-def process_gemini_response(response_text):
+# Schema Gemini must follow so its response can be parsed directly as JSON
+_TIP_LIST_SCHEMA = {"type": "ARRAY", "items": {"type": "STRING"}}
+_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "common_name": {"type": "STRING"},
+        "hindi_name": {"type": "STRING"},
+        "care": {
+            "type": "OBJECT",
+            "properties": {
+                "Spring": _TIP_LIST_SCHEMA,
+                "Summer": _TIP_LIST_SCHEMA,
+                "Monsoon": _TIP_LIST_SCHEMA,
+                "Winter": _TIP_LIST_SCHEMA
+            },
+            "required": ["Spring", "Summer", "Monsoon", "Winter"]
+        }
+    },
+    "required": ["common_name", "hindi_name", "care"]
+}
+
+def get_plant_info_prompt():
     """
-    Parse and structure the AI's response into a consistent format.
-    Handles variations in AI response and extracts key plant information.
+    Generate a structured prompt for AI to analyze plant images.
+    Provides clear instructions for detailed plant information.
     """
-    plant_info = {
-        'common_name': 'Unknown',
-        'hindi_name': 'Not available',
-        'care_instructions': {
-            'Spring': [], 'Summer': [], 'Monsoon': [], 'Winter': []
-        }
-    }
+    return _PROMPT
 
-    current_section = None
-    for line in response_text.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
+# Placeholder answers that mean the AI found no Hindi name
+_MISSING_HINDI_NAMES = frozenset({'unknown', 'not available', 'n/a', ''})
+
+def process_gemini_response(response_text):
+    """
+    Parse the AI's JSON response into a consistent format.
+    Fills in defaults for any missing fields or seasons, and returns None
+    if the response is not a JSON object.
+    """
+    try:
+        data = json.loads(response_text)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict):
+        return None
 
-        if line.lower().startswith('common name:'):
-            plant_info['common_name'] = line.split(':', 1)[1].strip()
-        elif any(phrase in line.lower() for phrase in ['hindi name:', 'hindi:', 'in hindi:']):
-            hindi_name = line.split(':', 1)[1].strip()
-            if hindi_name.lower() not in ['unknown', 'not available', 'n/a', '']:
-                plant_info['hindi_name'] = hindi_name
-        elif any(line.startswith(f"{season} Care:") for season in plant_info['care_instructions']):
-            current_section = line.split(':')[0].strip().split()[0]
-        elif current_section and line.startswith('•'):
-            plant_info['care_instructions'][current_section].append(line.lstrip('• ').strip())
+    hindi_name = str(data.get('hindi_name') or '').strip()
+    care = data.get('care')
+    if not isinstance(care, dict):
+        care = {}
+    care_instructions = {}
+    for season in ('Spring', 'Summer', 'Monsoon', 'Winter'):
+        tips = care.get(season)
+        care_instructions[season] = [str(tip) for tip in tips if tip] if isinstance(tips, list) else []
 
-    return plant_info
+    return {
+        'common_name': str(data.get('common_name') or 'Unknown'),
+        'hindi_name': hindi_name if hindi_name.lower() not in _MISSING_HINDI_NAMES else 'Not available',
+        'care_instructions': care_instructions
+    }
 
 def display_plant_info(plant_info):
     """
@@ -222,27 +236,16 @@ def display_plant_info(plant_info):
     """
     st.markdown("### 🌱 Plant Identification Results")
     
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(
-            f"""
-            <div class="info-box">
-                <div class="plant-name">Common Name</div>
-                {plant_info['common_name']}
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
-    with col2:
-        st.markdown(
-            f"""
-            <div class="info-box">
-                <div class="plant-name">Hindi Name</div>
-                {plant_info['hindi_name']}
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+    # Build both info boxes up front and emit each with a single call.
+    # AI output is escaped since it is placed inside raw HTML.
+    info_boxes = [
+        f'<div class="info-box"><div class="plant-name">{label}</div>{html.escape(value)}</div>'
+        for label, value in (('Common Name', plant_info['common_name']),
+                             ('Hindi Name', plant_info['hindi_name']))
+    ]
+    for col, box in zip(st.columns(2), info_boxes):
+        with col:
+            st.markdown(box, unsafe_allow_html=True)
 
     st.markdown("### 🌿 Seasonal Care Tips")
     tabs = st.tabs(['Spring', 'Summer', 'Monsoon', 'Winter'])
@@ -250,28 +253,177 @@ def display_plant_info(plant_info):
         with tab:
             tips = plant_info['care_instructions'][season]
             if tips:
-                st.markdown('<div class="tab-content">', unsafe_allow_html=True)
-                for tip in tips:
-                    st.markdown(f"• {tip}")
-                st.markdown('</div>', unsafe_allow_html=True)
+                tab_html = '<div class="tab-content"><ul>' + ''.join(f'<li>{html.escape(tip)}</li>' for tip in tips) + '</ul></div>'
+                st.markdown(tab_html, unsafe_allow_html=True)
             else:
                 st.markdown('<div class="tab-content">No specific care tips available for this season. Adjust care based on your local climate conditions.</div>', unsafe_allow_html=True)
 
-async def process_plant_image(model, image_data, prompt):
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
     """
-    Asynchronously process the plant image using the AI model.
-    Allows non-blocking execution of AI analysis.
+    Start a long-lived event loop on a daemon thread for async AI calls.
+    Shared across reruns and sessions so loop setup happens once per process.
     """
-    response = await model.generate_content_async(
-        [prompt, image_data],
-        generation_config={
-            "temperature": 0.2,
-            "max_output_tokens": 300,
-            "top_p": 0.8,
-            "top_k": 40
-        }
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+# Per-attempt deadline for a Gemini request, so timed-out attempts can be retried
+_REQUEST_TIMEOUT = 15
+# Attempts per Gemini request, and the backoff between them (base doubles each retry, plus jitter)
+_RETRIES = 4
+_RETRY_BASE = 0.5
+_RETRY_JITTER = 0.25
+
+async def call_with_retry(fn, *args, retries=_RETRIES, base=_RETRY_BASE, **kwargs):
+    """
+    Await an AI call, retrying transient failures with jittered exponential backoff.
+    Covers rate limiting, temporary unavailability and deadline errors.
+    """
+    for attempt in range(retries):
+        try:
+            return await fn(*args, **kwargs)
+        except (ResourceExhausted, ServiceUnavailable, DeadlineExceeded):
+            if attempt == retries - 1:
+                raise
+            await asyncio.sleep(base * 2 ** attempt + random.random() * _RETRY_JITTER)
+
+# At most this many Gemini requests are in flight at once
+_MAX_CONCURRENCY = 5
+# Time allowed per image: every attempt plus the longest possible backoff sleeps between them
+_IMAGE_TIMEOUT = _RETRIES * _REQUEST_TIMEOUT + sum(
+    _RETRY_BASE * 2 ** attempt + _RETRY_JITTER for attempt in range(_RETRIES - 1)
+)
+
+async def process_plant_images(model, image_datas, prompt, max_concurrency=_MAX_CONCURRENCY):
+    """
+    Asynchronously process a batch of plant images using the AI model.
+    Requests run concurrently, bounded by a semaphore, and retry transient failures.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def process_one(image_data):
+        async with semaphore:
+            request = call_with_retry(
+                model.generate_content_async,
+                [prompt, image_data],
+                generation_config={
+                    "temperature": 0.2,
+                    "max_output_tokens": 250,
+                    "top_p": 0.8,
+                    "top_k": 40,
+                    "response_mime_type": "application/json",
+                    "response_schema": _RESPONSE_SCHEMA
+                },
+                request_options={"timeout": _REQUEST_TIMEOUT}
+            )
+            try:
+                return await asyncio.wait_for(request, timeout=_IMAGE_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise TimeoutError("AI analysis timed out") from None
+
+    # Collect per-image exceptions so one failure doesn't discard the other results
+    return await asyncio.gather(
+        *(process_one(image_data) for image_data in image_datas), return_exceptions=True
+    )
+
+# Identification results are kept per image for a day, for a bounded number of images
+_RESULT_TTL = 24 * 60 * 60
+_MAX_CACHED_RESULTS = 256
+
+@st.cache_resource(show_spinner=False)
+def get_result_cache():
+    """
+    Hold identification results per image, shared across reruns and sessions.
+    Keyed by image hash so adding or removing files keeps earlier results.
+    """
+    return {}, threading.Lock()
+
+def get_cached_plant_info(key):
+    """
+    Return the cached plant info for an image hash, or None if missing or expired.
+    """
+    cache, lock = get_result_cache()
+    with lock:
+        entry = cache.get(key)
+    if entry and time.monotonic() - entry[0] < _RESULT_TTL:
+        return entry[1]
+    return None
+
+def cache_plant_info(key, plant_info):
+    """
+    Store plant info for an image hash, evicting the oldest entries when full.
+    """
+    cache, lock = get_result_cache()
+    with lock:
+        cache.pop(key, None)
+        while len(cache) >= _MAX_CACHED_RESULTS:
+            cache.pop(next(iter(cache)))
+        cache[key] = (time.monotonic(), plant_info)
+
+def identify_plants(images: tuple, on_progress=None) -> list:
+    """
+    Run the full identification pipeline for a batch of uploaded images.
+    Cached images skip the AI round-trip; the rest are sent concurrently.
+    Each result is the plant info, None if the response could not be interpreted,
+    or the exception raised for that image. on_progress is called with a
+    percentage as each stage finishes.
+    """
+    keys = [hashlib.sha256(image_bytes).hexdigest() for image_bytes in images]
+    results = [get_cached_plant_info(key) for key in keys]
+
+    # Group uncached images by hash so duplicates in a batch are sent only once
+    pending = {}
+    for index, (key, image_bytes) in enumerate(zip(keys, images)):
+        if results[index] is None:
+            pending.setdefault(key, (image_bytes, []))[1].append(index)
+
+    misses, image_datas = [], []
+    for key, (image_bytes, indices) in pending.items():
+        try:
+            image_data = prepare_image(image_bytes)
+        except Exception as e:
+            for index in indices:
+                results[index] = ValueError(f"Error processing image: {str(e)}")
+            continue
+        misses.append((key, indices))
+        image_datas.append(image_data)
+
+    if not image_datas:
+        return results
+    if on_progress:
+        on_progress(25)
+
+    model = initialize_gemini()
+    future = asyncio.run_coroutine_threadsafe(
+        process_plant_images(model, image_datas, get_plant_info_prompt()), get_event_loop()
     )
-    return response
+    # Each image has its own timeout; this only guards against the batch hanging
+    batch_timeout = math.ceil(len(image_datas) / _MAX_CONCURRENCY) * _IMAGE_TIMEOUT + 5
+    try:
+        responses = future.result(timeout=batch_timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise TimeoutError("AI analysis timed out") from None
+    if on_progress:
+        on_progress(75)
+
+    for (key, indices), response in zip(misses, responses):
+        if isinstance(response, BaseException):
+            outcome = response
+        else:
+            try:
+                if not (response and response.text):
+                    raise ValueError("No response received from AI")
+                # A response cut off at the token limit fails to parse and yields None
+                outcome = process_gemini_response(response.text)
+            except Exception as e:
+                outcome = e
+            if outcome and not isinstance(outcome, BaseException):
+                cache_plant_info(key, outcome)
+        for index in indices:
+            results[index] = outcome
+    return results
 
 def main():
     """
@@ -283,93 +435,74 @@ def main():
     <p style='text-align: center;'>Upload a plant photo to get identification and care tips!</p>
     """, unsafe_allow_html=True)
 
-    # Initialize fun loading messages
-    if 'messages' not in st.session_state:
-        st.session_state.messages = get_fun_loading_messages()
-
     # Initialize Gemini AI model
-    model = initialize_gemini()
-    if not model:
+    try:
+        initialize_gemini()
+    except Exception as e:
+        st.error(f"⚠️ Error initializing AI model: {str(e)}")
         st.error("Could not initialize AI model. Please check your configuration.")
         st.stop()
 
     # Image upload
-    uploaded_file = st.file_uploader("Choose a plant image", type=['png', 'jpg', 'jpeg'])
+    uploaded_files = st.file_uploader(
+        "Choose plant images", type=['png', 'jpg', 'jpeg'], accept_multiple_files=True
+    )
 
-    if uploaded_file:
-        image = Image.open(uploaded_file)
+    if uploaded_files:
+        # Read each upload once; the bytes feed both the preview and the AI pipeline
+        images = tuple(uploaded_file.getvalue() for uploaded_file in uploaded_files)
         col1, col2, col3 = st.columns([1,2,1])
         with col2:
             st.markdown('<div class="preview-image">', unsafe_allow_html=True)
-            st.image(image, caption="Uploaded Plant Image", use_container_width=True, width=300)
+            st.image(list(images), caption=[uploaded_file.name for uploaded_file in uploaded_files],
+                     use_container_width=True)
             st.markdown('</div>', unsafe_allow_html=True)
 
         if st.button("Identify Plant"):
             # Create containers for loading and progress
             loading_container = st.empty()
-            progress_text = st.empty()
             progress_bar = st.progress(0)
             loading_placeholder = st.empty()
 
             try:
                 # Prepare image and show initial loading message
                 loading_placeholder.markdown(
-                    f'<div class="loading-box">{random.choice(st.session_state.messages)}</div>', 
+                    f'<div class="loading-box">{random.choice(_MESSAGES)}</div>', 
                     unsafe_allow_html=True
                 )
                 
-                # Function to update progress
-                def update_progress(percentage):
-                    progress_bar.progress(percentage)
-                    progress_text.markdown(
-                        f'<div class="progress-text">Progress: {percentage}%</div>', 
-                        unsafe_allow_html=True
-                    )
-
-                # Image processing
-                image_data = prepare_image(image)
-                if not image_data:
-                    st.error("Image preparation failed")
-                    st.stop()
-                update_progress(25)
-
-                # Prepare for AI processing
-                loading_placeholder.markdown(
-                    f'<div class="loading-box">{random.choice(st.session_state.messages)}</div>', 
-                    unsafe_allow_html=True
-                )
-                update_progress(50)
-
-                # Run AI analysis
-                with st.spinner("Analyzing plant..."):
-                    response = asyncio.run(process_plant_image(model, image_data, get_plant_info_prompt()))
+                # Function to update progress, optionally showing a new loading message
+                def update_progress(percentage, new_message=True):
+                    progress_bar.progress(percentage, text=f"Progress: {percentage}%")
+                    if new_message:
+                        loading_placeholder.markdown(
+                            f'<div class="loading-box">{random.choice(_MESSAGES)}</div>', 
+                            unsafe_allow_html=True
+                        )
 
-                update_progress(75)
+                # Run AI analysis concurrently for all images (cached per image);
+                # progress advances as images are prepared and responses arrive
+                with st.spinner("Analyzing plants..." if len(images) > 1 else "Analyzing plant..."):
+                    results = identify_plants(images, on_progress=update_progress)
 
-                # Process AI response
-                loading_placeholder.markdown(
-                    f'<div class="loading-box">{random.choice(st.session_state.messages)}</div>', 
-                    unsafe_allow_html=True
-                )
+                # The loading message is cleared right away, so don't replace it
+                update_progress(100, new_message=False)
+                
+                # Clear loading elements
+                loading_container.empty()
+                loading_placeholder.empty()
+                progress_bar.empty()
                 
-                if response and response.text:
-                    plant_info = process_gemini_response(response.text)
-                    if plant_info:
-                        update_progress(100)
-                        time.sleep(0.5)  # Pause for visual feedback
-                        
-                        # Clear loading elements
-                        loading_container.empty()
-                        progress_text.empty()
-                        loading_placeholder.empty()
-                        progress_bar.empty()
-                        
-                        # Display plant information
-                        display_plant_info(plant_info)
+                # Display plant information for each image
+                for uploaded_file, result in zip(uploaded_files, results):
+                    if len(uploaded_files) > 1:
+                        st.markdown(f"## 📷 {uploaded_file.name}")
+                    if isinstance(result, BaseException):
+                        st.error(f"Error identifying {uploaded_file.name}: {str(result)}")
+                    elif result:
+                        display_plant_info(result)
                     else:
-                        st.error("Could not interpret plant information")
-                else:
-                    st.error("No response received from AI")
+                        st.error(f"Could not interpret plant information for {uploaded_file.name}")
 
             except Exception as e:
                 st.error(f"Error during plant identification: {str(e)}")